@@ -5,18 +5,20 @@
 """
 
 import asyncio
-import json
 import sqlite3
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+import orjson
 import uvicorn
 
 # 导入钱包监控模块
@@ -71,9 +73,45 @@ class HistoryPoint(BaseModel):
 
 DB_PATH = Path("wallet_history.db")
 
+# 历史查询结果缓存: days -> (缓存时间, 结果)；写入新记录时清空
+HISTORY_CACHE_TTL = 60
+_history_cache: Dict[int, Tuple[float, List[dict]]] = {}
+
+# 进程内共享一个连接，避免每次读写都重新打开数据库
+_db_conn: Optional[sqlite3.Connection] = None
+
+# 所有数据库操作都提交到这个单线程执行器：共享连接只在这一个线程中使用，访问天然串行，
+# 提交时的 fsync 也不会阻塞事件循环；因此数据库函数只能通过 run_db 调用
+_db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+
+async def run_db(func, *args):
+    """在数据库线程中执行同步的数据库函数"""
+    return await asyncio.get_running_loop().run_in_executor(_db_executor, func, *args)
+
+def get_db() -> sqlite3.Connection:
+    """获取共享的数据库连接，首次调用时打开并设置 WAL 等参数"""
+    global _db_conn
+    if _db_conn is None:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        # WAL: 写入时不阻塞读取；synchronous=NORMAL 在 WAL 下每次提交无需 fsync
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        _db_conn = conn
+    return _db_conn
+
+def close_db():
+    """关闭共享的数据库连接"""
+    global _db_conn
+    if _db_conn is not None:
+        _db_conn.close()
+        _db_conn = None
+
 def init_db():
     """初始化数据库"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db()
     cursor = conn.cursor()
     
     # 创建历史记录表
@@ -88,6 +126,11 @@ def init_db():
         )
     """)
     
+    # 按时间范围查询历史，避免全表扫描
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_history_ts ON balance_history(timestamp)
+    """)
+    
     # 创建钱包快照表
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS wallet_snapshots (
@@ -100,42 +143,38 @@ def init_db():
     """)
     
     conn.commit()
-    conn.close()
 
 def save_history(total_usd: float, defi_usd: float, debt_usd: float, data: dict):
     """保存历史记录"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute("""
+    conn = get_db()
+    conn.execute("""
         INSERT INTO balance_history (timestamp, total_usd, defi_usd, debt_usd, data_json)
         VALUES (?, ?, ?, ?, ?)
-    """, (datetime.now().isoformat(), total_usd, defi_usd, debt_usd, json.dumps(data)))
-    
+    """, (datetime.now().isoformat(), total_usd, defi_usd, debt_usd, orjson.dumps(data).decode()))
     conn.commit()
-    conn.close()
+    _history_cache.clear()
 
 def get_history(days: int = 7) -> List[dict]:
-    """获取历史记录"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    """获取历史记录 (结果缓存 HISTORY_CACHE_TTL 秒)"""
+    cached = _history_cache.get(days)
+    if cached and time.monotonic() - cached[0] < HISTORY_CACHE_TTL:
+        return cached[1]
     
     since = (datetime.now() - timedelta(days=days)).isoformat()
     
-    cursor.execute("""
+    rows = get_db().execute("""
         SELECT timestamp, total_usd, defi_usd, debt_usd
         FROM balance_history
         WHERE timestamp > ?
         ORDER BY timestamp ASC
-    """, (since,))
-    
-    rows = cursor.fetchall()
-    conn.close()
+    """, (since,)).fetchall()
     
-    return [
+    history = [
         {"timestamp": row[0], "total_usd": row[1], "defi_usd": row[2], "debt_usd": row[3]}
         for row in rows
     ]
+    _history_cache[days] = (time.monotonic(), history)
+    return history
 
 
 # ========== 全局状态 ==========
@@ -147,9 +186,39 @@ class AppState:
         self.last_update: Optional[datetime] = None
         self.is_updating: bool = False
         self.summary: Optional[DashboardSummary] = None
+        # /api/wallets 的序列化结果，每轮更新后预先生成
+        self.wallets_json: Optional[bytes] = None
+        # /api/wallets 的 ETag，取自本轮更新时间，进程重启后也不会与旧值重复
+        self.wallets_etag: Optional[str] = None
+        # (链名小写, 地址小写) -> 钱包，供单钱包查询直接命中
+        self.wallet_index: Dict[Tuple[str, str], WalletBalance] = {}
+        # 仪表盘页面内容、读取时文件的修改时间及上次检查时间，文件变化后重新读取
+        self.index_html: Optional[bytes] = None
+        self.index_mtime: Optional[int] = None
+        self.index_checked: float = 0.0
 
 state = AppState()
 
+INDEX_PATH = Path("static/index.html")
+INDEX_CHECK_INTERVAL = 5  # 检查页面文件是否修改的最短间隔 (秒)，其余请求直接返回内存中的内容
+
+def load_index_html() -> Optional[bytes]:
+    """返回仪表盘页面内容；每 INDEX_CHECK_INTERVAL 秒最多检查一次文件，修改后重新读取"""
+    now = time.monotonic()
+    if state.index_checked and now - state.index_checked < INDEX_CHECK_INTERVAL:
+        return state.index_html
+    state.index_checked = now
+    
+    try:
+        mtime = INDEX_PATH.stat().st_mtime_ns
+    except OSError:
+        state.index_html = state.index_mtime = None
+        return None
+    if mtime != state.index_mtime:
+        state.index_html = INDEX_PATH.read_bytes()
+        state.index_mtime = mtime
+    return state.index_html
+
 
 # ========== FastAPI 应用 ==========
 
@@ -178,7 +247,9 @@ async def background_scheduler():
 async def lifespan(app: FastAPI):
     """应用生命周期管理"""
     # 启动时初始化
-    init_db()
+    await run_db(init_db)
+    
+    load_index_html()
     
     # 优先使用 config.local.yaml，否则使用 config.yaml
     config_file = "config.local.yaml" if Path("config.local.yaml").exists() else "config.yaml"
@@ -203,6 +274,9 @@ async def lifespan(app: FastAPI):
     # 关闭时清理
     if scheduler_task:
         scheduler_task.cancel()
+    if state.monitor:
+        await state.monitor.close()
+    await run_db(close_db)
     print("👋 服务器关闭")
 
 
@@ -231,8 +305,8 @@ if static_dir.exists():
 # ========== 辅助函数 ==========
 
 def convert_token(token: TokenBalance) -> TokenBalanceResponse:
-    """转换代币对象"""
-    return TokenBalanceResponse(
+    """转换代币对象 (数据来自内部 dataclass，跳过 Pydantic 校验)"""
+    return TokenBalanceResponse.model_construct(
         symbol=token.symbol,
         name=token.name,
         balance=token.balance,
@@ -242,11 +316,15 @@ def convert_token(token: TokenBalance) -> TokenBalanceResponse:
 
 def convert_position(pos: DeFiPosition) -> DeFiPositionResponse:
     """转换 DeFi 仓位对象"""
-    response = DeFiPositionResponse(
+    response = DeFiPositionResponse.model_construct(
         protocol=pos.protocol,
         position_type=pos.position_type,
         tokens=[convert_token(t) for t in pos.tokens],
-        total_usd_value=pos.total_usd_value
+        total_usd_value=pos.total_usd_value,
+        supplied=None,
+        borrowed=None,
+        health_factor=None,
+        net_worth_usd=None
     )
     
     # 借贷详情
@@ -261,7 +339,7 @@ def convert_position(pos: DeFiPosition) -> DeFiPositionResponse:
 
 def convert_wallet(wallet: WalletBalance) -> WalletResponse:
     """转换钱包对象"""
-    return WalletResponse(
+    return WalletResponse.model_construct(
         chain=wallet.chain,
         address=wallet.address,
         name=wallet.name,
@@ -273,37 +351,39 @@ def convert_wallet(wallet: WalletBalance) -> WalletResponse:
         timestamp=wallet.timestamp.isoformat()
     )
 
+def serialize_wallets(balances: List[WalletBalance]) -> bytes:
+    """把钱包列表转换并序列化为 JSON"""
+    return orjson.dumps([convert_wallet(w).model_dump() for w in balances])
+
 def calculate_summary(balances: List[WalletBalance]) -> DashboardSummary:
     """计算汇总数据"""
     total_usd = 0.0
     total_defi = 0.0
     total_debt = 0.0
     chains: Dict[str, float] = {}
+    chains_get = chains.get
     
     for balance in balances:
-        chain_total = 0.0
-        
-        # 原生代币
-        if balance.native_usd_value:
-            chain_total += balance.native_usd_value
-        
-        # 代币
-        for token in balance.tokens:
-            if token.usd_value:
-                chain_total += token.usd_value
+        # 原生代币 + 代币
+        chain_total = (balance.native_usd_value or 0.0) + sum(
+            token.usd_value for token in balance.tokens if token.usd_value
+        )
         
         # DeFi 仓位
         for pos in balance.defi_positions:
-            if pos.lending_details:
-                chain_total += pos.lending_details.net_worth_usd
-                total_defi += pos.lending_details.total_supplied_usd
-                total_debt += pos.lending_details.total_borrowed_usd
+            ld = pos.lending_details
+            if ld:
+                chain_total += ld.net_worth_usd
+                total_defi += ld.total_supplied_usd
+                total_debt += ld.total_borrowed_usd
             elif pos.total_usd_value:
-                chain_total += pos.total_usd_value
-                total_defi += pos.total_usd_value
+                value = pos.total_usd_value
+                chain_total += value
+                total_defi += value
         
         total_usd += chain_total
-        chains[balance.chain] = chains.get(balance.chain, 0) + chain_total
+        chain = balance.chain
+        chains[chain] = chains_get(chain, 0.0) + chain_total
     
     return DashboardSummary(
         total_usd_value=total_usd,
@@ -320,9 +400,10 @@ def calculate_summary(balances: List[WalletBalance]) -> DashboardSummary:
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """返回仪表盘页面"""
-    index_path = Path("static/index.html")
-    if index_path.exists():
-        return FileResponse(index_path)
+    index_html = load_index_html()
+    if index_html is not None:
+        # 允许浏览器短时间缓存，刷新页面时不必重新请求
+        return HTMLResponse(index_html, headers={"Cache-Control": "public, max-age=60"})
     return HTMLResponse("<h1>钱包监控仪表盘</h1><p>请先创建 static/index.html</p>")
 
 
@@ -343,27 +424,32 @@ async def get_summary():
 
 
 @app.get("/api/wallets")
-async def get_wallets():
+async def get_wallets(request: Request):
     """获取所有钱包余额"""
-    if not state.last_balances:
+    if state.wallets_json is None:
         # 返回空列表而不是 404
         return []
-    return [convert_wallet(w) for w in state.last_balances]
+    # 数据未更新时返回 304，客户端沿用缓存
+    etag = state.wallets_etag
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=state.wallets_json, media_type="application/json", headers={"ETag": etag})
 
 
 @app.get("/api/wallet/{chain}/{address}", response_model=WalletResponse)
 async def get_wallet(chain: str, address: str):
     """获取单个钱包余额"""
-    for wallet in state.last_balances:
-        if wallet.chain.lower() == chain.lower() and wallet.address.lower() == address.lower():
-            return convert_wallet(wallet)
-    raise HTTPException(status_code=404, detail="钱包未找到")
+    wallet = state.wallet_index.get((chain.lower(), address.lower()))
+    if wallet is None:
+        raise HTTPException(status_code=404, detail="钱包未找到")
+    return convert_wallet(wallet)
 
 
 @app.get("/api/history")
 async def get_balance_history(days: int = 7):
     """获取历史余额"""
-    return get_history(days)
+    history = await run_db(get_history, days)
+    return Response(content=orjson.dumps(history), media_type="application/json")
 
 
 @app.post("/api/refresh")
@@ -395,22 +481,25 @@ async def update_balances():
         print("🔄 开始更新余额...")
         print(f"   监控链: {list(state.monitor.monitors.keys())}")
         
-        # 更新价格
-        print("   📈 获取价格...")
-        await state.monitor.price_service.update_prices()
-        
-        # 获取余额
-        print("   🔍 查询余额...")
-        balances = await state.monitor.check_all_balances()
+        # 价格与余额并行获取
+        print("   📈 获取价格 & 🔍 查询余额...")
+        prices_task = asyncio.ensure_future(state.monitor.price_service.update_prices())
+        balances = await state.monitor.check_all_balances(prices_task)
+        await prices_task
         
         print(f"   📊 获取到 {len(balances)} 个钱包数据")
         
         state.last_balances = balances
         state.last_update = datetime.now()
         state.summary = calculate_summary(balances)
+        # 余额只在这里变化，提前序列化好，请求时直接返回字节
+        state.wallets_json = serialize_wallets(balances)
+        state.wallet_index = {(w.chain.lower(), w.address.lower()): w for w in balances}
+        state.wallets_etag = f'W/"{state.last_update.timestamp():.6f}"'
         
         # 保存历史
-        save_history(
+        await run_db(
+            save_history,
             state.summary.total_usd_value,
             state.summary.total_defi_value,
             state.summary.total_debt_value,
@@ -446,5 +535,7 @@ if __name__ == "__main__":
         "api_server:app",
         host="0.0.0.0",
         port=8000,
+        loop="auto",  # 安装了 uvloop 时自动使用，Windows 下回退到 asyncio
+        http="auto",  # 同理优先 httptools
         reload=True
     )
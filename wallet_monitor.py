@@ -7,9 +7,15 @@
 
 import asyncio
 import aiohttp
+import orjson
 import yaml
-import json
+import gzip
+import os
+import random
+import re
+import sys
 import time
+import zlib
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
@@ -67,11 +73,203 @@ class WalletBalance:
     defi_positions: List[DeFiPosition] = field(default_factory=list)
 
 
+# ========== JSON-RPC 工具 ==========
+
+RPC_BATCH_SIZE = 50  # 单次 JSON-RPC 批量请求的最大条数
+RPC_MAX_CONCURRENCY = 8  # 同时在途的批量请求数上限
+REQUEST_TIMEOUT = 30  # 单个 HTTP 请求的默认总超时 (秒)；aiohttp 默认 5 分钟，节点挂起时会拖住整轮查询
+RPC_MAX_RETRIES = 4  # 网络错误 / 限流时的最大重试次数
+RPC_RETRY_BASE_DELAY = 0.25  # 指数退避的初始等待 (秒)
+RPC_RETRY_MAX_DELAY = 4.0  # 单次退避等待上限 (秒)
+RETRYABLE_STATUS = frozenset((429, 502, 503))  # 限流 / 网关错误 / 节点暂时不可用
+RPC_RETRY_AFTER_MAX = 30.0  # 服务端 Retry-After 的采纳上限 (秒)
+EMPTY_CALL_RESULTS = frozenset(("0x", "0x0"))  # eth_call 的空返回值
+# ERC-20 balanceOf(address) 选择器 + 地址左侧补零部分，拼上 40 位地址即为完整 calldata
+BALANCE_OF_PREFIX = "0x70a08231" + "0" * 24
+# 只有存在 SSL 连接泄漏问题的 Python 版本需要 enable_cleanup_closed；已修复的版本上 aiohttp 会忽略该参数并发出 DeprecationWarning
+NEEDS_CLEANUP_CLOSED = sys.version_info < (3, 12, 8) or (3, 13, 0) <= sys.version_info < (3, 13, 1)
+
+
+def create_session(timeout: float = REQUEST_TIMEOUT) -> aiohttp.ClientSession:
+    """创建 HTTP 会话：协商 gzip 压缩响应，并复用连接 (keep-alive + DNS 缓存)"""
+    # 单个 RPC 节点最多占用 16 条连接，空闲连接保持 60 秒以跨轮次复用
+    connector = aiohttp.TCPConnector(
+        limit=32,
+        limit_per_host=16,
+        keepalive_timeout=60,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=NEEDS_CLEANUP_CLOSED  # 及时回收异常断开的 TLS 连接，长时间运行时不泄漏
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        # 请求头在会话级设置一次，rpc_post 不必逐个请求传入
+        headers={
+            "Accept-Encoding": "gzip, deflate",
+            "Content-Type": "application/json"
+        }
+    )
+
+
+class HttpSession:
+    """惰性创建、可在多个组件间共享的 HTTP 会话"""
+    
+    def __init__(self, timeout: float = REQUEST_TIMEOUT):
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def get(self) -> aiohttp.ClientSession:
+        """首次调用时创建会话，之后返回同一个 (关闭后会重新创建)"""
+        if self._session is None or self._session.closed:
+            self._session = create_session(self.timeout)
+        return self._session
+    
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+
+class RateLimiter:
+    """令牌桶限流：长期平均每秒不超过 rate 个请求，空闲后允许最多 burst 个请求立即发出"""
+    
+    def __init__(self, rate: float, burst: int = RPC_MAX_CONCURRENCY):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """取得一个令牌，桶空时等待到下一个令牌生成"""
+        async with self._lock:  # 等待者按到达顺序依次取令牌
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class RpcError(Exception):
+    """RPC 节点返回错误，或一批请求整体失败"""
+
+
+def _retry_after_seconds(response: aiohttp.ClientResponse) -> Optional[float]:
+    """解析 Retry-After 响应头 (秒数形式)，缺失或无法解析时返回 None"""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return min(max(float(value), 0.0), RPC_RETRY_AFTER_MAX)
+    except ValueError:
+        return None  # HTTP 日期形式在 RPC 节点中很少见，按普通退避处理
+
+
+async def rpc_post(session: aiohttp.ClientSession, rpc_url: str, payload: object,
+                   limiter: Optional[RateLimiter] = None) -> object:
+    """发送 JSON-RPC 请求；直接用 orjson 编码请求体，省去 aiohttp 的 str/bytes 往返"""
+    # 网络错误、超时以及 429/502/503 响应按指数退避 (带随机抖动) 重试，最多 RPC_MAX_RETRIES 次
+    body = orjson.dumps(payload)
+    
+    for attempt in range(RPC_MAX_RETRIES + 1):
+        retryable = attempt < RPC_MAX_RETRIES
+        retry_after = None
+        if limiter is not None:
+            await limiter.acquire()  # 重试同样计入限流
+        try:
+            async with session.post(rpc_url, data=body) as response:
+                if not (retryable and response.status in RETRYABLE_STATUS):
+                    return orjson.loads(await response.read())
+                retry_after = _retry_after_seconds(response)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if not retryable:
+                raise
+        
+        # 全抖动退避：在 [0, min(上限, 初始值 * 2^attempt)] 内随机等待，避免多个请求同时重试
+        delay = random.uniform(0, min(RPC_RETRY_MAX_DELAY, RPC_RETRY_BASE_DELAY * 2 ** attempt))
+        # 服务端给出了 Retry-After 时至少等待这么久，提前重试只会再次被限流
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        await asyncio.sleep(delay)
+
+
+def _batch_unsupported(data: object) -> bool:
+    """节点返回的单个错误对象是否表示其不支持批量请求"""
+    # 限流 (429 / -32005) 等其他错误换成逐个请求只会放大负载，不在此列
+    if not isinstance(data, dict):
+        return False
+    error = data.get("error")
+    if not isinstance(error, dict):
+        return False
+    return error.get("code") == -32600 or "batch" in str(error.get("message", "")).lower()
+
+
+async def rpc_batch(session: aiohttp.ClientSession, rpc_url: str, calls: List[Tuple[str, list]],
+                    limiter: Optional[RateLimiter] = None) -> List[Optional[object]]:
+    """批量发送 JSON-RPC 请求 (数组负载)，按输入顺序返回每个请求的 result，单个失败的为 None"""
+    # 整批失败 (网络错误 / 重试用尽 / 节点返回错误对象) 时抛出异常，避免把查询失败当成零余额
+    results: List[Optional[object]] = [None] * len(calls)
+    semaphore = asyncio.Semaphore(RPC_MAX_CONCURRENCY)
+    
+    async def send_chunk(start: int):
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls[start:start + RPC_BATCH_SIZE], start)
+        ]
+        
+        async with semaphore:
+            data = await rpc_post(session, rpc_url, payload, limiter)
+            
+            # 部分节点不支持批量请求，会返回单个错误对象；仅此时退回逐个请求
+            if _batch_unsupported(data):
+                data = await asyncio.gather(
+                    *(rpc_post(session, rpc_url, request, limiter) for request in payload),
+                    return_exceptions=True
+                )
+                if all(isinstance(item, BaseException) for item in data):
+                    raise data[0]
+            elif not isinstance(data, list):
+                raise RpcError(f"批量请求失败: {data.get('error') if isinstance(data, dict) else data}")
+        
+        # 规范不保证响应顺序，按 id 对齐
+        for item in data:
+            if isinstance(item, dict) and "result" in item:
+                results[item["id"]] = item["result"]
+    
+    await asyncio.gather(*(send_chunk(start) for start in range(0, len(calls), RPC_BATCH_SIZE)))
+    return results
+
+
 class ChainMonitor(ABC):
     """链监控基类"""
     
-    def __init__(self, config: dict):
+    # 地址格式，子类按链设置；格式不对的地址不发起任何请求
+    ADDRESS_PATTERN: Optional[re.Pattern] = None
+    
+    def __init__(self, config: dict, http: Optional[HttpSession] = None):
         self.config = config
+        # 未传入共享会话时单独持有一个
+        self.http = http or HttpSession()
+        # 按 api_delay 换算的令牌桶，约束发往该链节点的平均请求速率
+        api_delay = config.get("api_delay", 0.1)  # 默认 100ms 延迟
+        self.rate_limiter = RateLimiter(1 / api_delay) if api_delay > 0 else None
+    
+    def get_session(self) -> aiohttp.ClientSession:
+        """获取复用的 HTTP 会话，首次调用时创建，后续请求共享连接池"""
+        return self.http.get()
+    
+    async def close(self):
+        """关闭 HTTP 会话"""
+        await self.http.close()
+    
+    def is_valid_address(self, address: object) -> bool:
+        """检查地址格式是否符合该链"""
+        # YAML 中未加引号的十六进制地址会被解析成整数，空值为 None，均视为无效
+        if not isinstance(address, str):
+            return False
+        return self.ADDRESS_PATTERN is None or self.ADDRESS_PATTERN.fullmatch(address) is not None
     
     @abstractmethod
     async def get_balance(self, address: str) -> Tuple[float, List[TokenBalance], List[DeFiPosition]]:
@@ -91,12 +289,53 @@ class ChainMonitor(ABC):
         pass
 
 
-class EthereumMonitor(ChainMonitor):
+class EVMChainMonitor(ChainMonitor):
+    """EVM 链监控基类 - Ethereum / Arbitrum 共用的 JSON-RPC 查询"""
+    
+    DEFAULT_RPC_URL = ""
+    ADDRESS_PATTERN = re.compile(r"0x[0-9a-fA-F]{40}")
+    TOKEN_DECIMALS: Dict[str, int] = {}  # 子类提供需要批量查询的 {合约地址: 精度}
+    
+    async def get_native_balance(self, session: aiohttp.ClientSession, address: str) -> float:
+        """获取原生 ETH 余额"""
+        rpc_url = self.config.get("rpc_url", self.DEFAULT_RPC_URL)
+        
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "eth_getBalance",
+            "params": [address, "latest"],
+            "id": 1
+        }
+        
+        data = await rpc_post(session, rpc_url, payload, self.rate_limiter)
+        if "result" in data:
+            balance_wei = int(data["result"], 16)
+            return balance_wei / 1e18
+        return 0.0
+    
+    async def get_token_balances(self, session: aiohttp.ClientSession,
+                                  address: str, tokens: Dict[str, int]) -> Dict[str, float]:
+        """批量获取 ERC-20 代币余额，tokens 为 {合约地址: 精度}"""
+        rpc_url = self.config.get("rpc_url", self.DEFAULT_RPC_URL)
+        
+        data = BALANCE_OF_PREFIX + address[2:].lower()
+        token_addrs = list(tokens)
+        calls = [("eth_call", [{"to": token_addr, "data": data}, "latest"]) for token_addr in token_addrs]
+        
+        # 查询失败时直接抛出，由 check_balance 跳过该钱包，而不是记成零余额
+        results = await rpc_batch(session, rpc_url, calls, self.rate_limiter)
+        
+        balances: Dict[str, float] = {}
+        for token_addr, result in zip(token_addrs, results):
+            if isinstance(result, str) and result not in EMPTY_CALL_RESULTS:
+                balances[token_addr] = int(result, 16) / (10 ** tokens[token_addr])
+        return balances
+
+
+class EthereumMonitor(EVMChainMonitor):
     """Ethereum 链监控 - 支持 ERC-20 代币和 DeFi（含借贷详情）"""
     
-    def __init__(self, config: dict):
-        super().__init__(config)
-        self.api_delay = config.get("api_delay", 0.1)  # 默认 100ms 延迟
+    DEFAULT_RPC_URL = "https://eth.llamarpc.com"
     
     # 常见 ERC-20 代币
     KNOWN_TOKENS = {
@@ -203,6 +442,13 @@ class EthereumMonitor(ChainMonitor):
         "0xA17581A9E3356d9A858b789D68B4d866e593aE94": ("cWETHv3", "Compound WETH", 18, "Compound V3"),
     }
     
+    # 批量查询用的 {合约地址: 精度}，类定义时生成一次
+    TOKEN_DECIMALS = {
+        token_addr: info[2]
+        for table in (KNOWN_TOKENS, STAKING_TOKENS, AAVE_V3_ATOKENS, AAVE_V3_DEBT_TOKENS, PENDLE_TOKENS)
+        for token_addr, info in table.items()
+    }
+    
     @property
     def chain_name(self) -> str:
         return "Ethereum"
@@ -211,198 +457,134 @@ class EthereumMonitor(ChainMonitor):
     def symbol(self) -> str:
         return "ETH"
     
-    async def get_native_balance(self, session: aiohttp.ClientSession, address: str) -> float:
-        """获取 ETH 余额"""
-        rpc_url = self.config.get("rpc_url", "https://eth.llamarpc.com")
-        
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "eth_getBalance",
-            "params": [address, "latest"],
-            "id": 1
-        }
-        
-        async with session.post(rpc_url, json=payload) as response:
-            data = await response.json()
-            if "result" in data:
-                balance_wei = int(data["result"], 16)
-                return balance_wei / 1e18
-            return 0.0
-    
-    async def get_token_balance(self, session: aiohttp.ClientSession, 
-                                 address: str, token_address: str, 
-                                 decimals: int) -> float:
-        """获取单个 ERC-20 代币余额"""
-        rpc_url = self.config.get("rpc_url", "https://eth.llamarpc.com")
-        
-        data = f"0x70a08231000000000000000000000000{address[2:].lower()}"
-        
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "eth_call",
-            "params": [{"to": token_address, "data": data}, "latest"],
-            "id": 1
-        }
-        
-        try:
-            async with session.post(rpc_url, json=payload) as response:
-                result = await response.json()
-                if "result" in result and result["result"] not in ["0x", "0x0"]:
-                    balance = int(result["result"], 16)
-                    return balance / (10 ** decimals)
-        except Exception:
-            pass
-        return 0.0
-    
     async def get_balance(self, address: str) -> Tuple[float, List[TokenBalance], List[DeFiPosition]]:
         """获取 ETH、ERC-20 代币和 DeFi 仓位"""
         tokens = []
         defi_positions = []
-        staking_by_protocol: Dict[str, List[TokenBalance]] = {}
+        staking_by_protocol: Dict[Tuple[str, str], List[TokenBalance]] = {}
         
         # Aave 借贷详情
         aave_supplied: List[TokenBalance] = []
         aave_borrowed: List[TokenBalance] = []
         
-        async with aiohttp.ClientSession() as session:
-            # 获取 ETH 余额
-            native_balance = await self.get_native_balance(session, address)
-            
-            # 获取常见 ERC-20 代币余额
-            for token_addr, (symbol, name, decimals) in self.KNOWN_TOKENS.items():
-                try:
-                    balance = await self.get_token_balance(session, address, token_addr, decimals)
-                    if balance > 0:
-                        tokens.append(TokenBalance(
-                            symbol=symbol,
-                            name=name,
-                            balance=balance,
-                            contract_address=token_addr,
-                            decimals=decimals,
-                            token_type="token"
-                        ))
-                    await asyncio.sleep(self.api_delay)  # API 限流延迟
-                except Exception:
-                    continue
-            
-            # 获取 Staking 代币余额
-            for token_addr, (symbol, name, decimals, protocol, pos_type) in self.STAKING_TOKENS.items():
-                try:
-                    balance = await self.get_token_balance(session, address, token_addr, decimals)
-                    if balance > 0:
-                        token = TokenBalance(
-                            symbol=symbol,
-                            name=name,
-                            balance=balance,
-                            contract_address=token_addr,
-                            decimals=decimals,
-                            token_type=pos_type
-                        )
-                        key = f"{protocol}|{pos_type}"
-                        if key not in staking_by_protocol:
-                            staking_by_protocol[key] = []
-                        staking_by_protocol[key].append(token)
-                    await asyncio.sleep(self.api_delay)  # API 限流延迟
-                except Exception:
-                    continue
-            
-            # ========== Aave V3 抵押品 (aTokens) ==========
-            for token_addr, (symbol, name, decimals, underlying) in self.AAVE_V3_ATOKENS.items():
-                try:
-                    balance = await self.get_token_balance(session, address, token_addr, decimals)
-                    if balance > 0:
-                        aave_supplied.append(TokenBalance(
-                            symbol=underlying,  # 显示底层资产符号
-                            name=f"Aave 抵押 {underlying}",
-                            balance=balance,
-                            contract_address=token_addr,
-                            decimals=decimals,
-                            token_type="collateral"
-                        ))
-                    await asyncio.sleep(self.api_delay)  # API 限流延迟
-                except Exception:
-                    continue
-            
-            # ========== Aave V3 债务 (Variable Debt Tokens) ==========
-            for token_addr, (symbol, name, decimals, underlying) in self.AAVE_V3_DEBT_TOKENS.items():
-                try:
-                    balance = await self.get_token_balance(session, address, token_addr, decimals)
-                    if balance > 0:
-                        aave_borrowed.append(TokenBalance(
-                            symbol=underlying,  # 显示底层资产符号
-                            name=f"Aave 债务 {underlying}",
-                            balance=balance,
-                            contract_address=token_addr,
-                            decimals=decimals,
-                            token_type="debt"
-                        ))
-                    await asyncio.sleep(self.api_delay)  # API 限流延迟
-                except Exception:
-                    continue
-            
-            # ========== Pendle 代币 ==========
-            pendle_positions: Dict[str, List[TokenBalance]] = {
-                "pt": [], "yt": [], "lp": [], "token": []
-            }
-            
-            for token_addr, (symbol, name, decimals, pos_type) in self.PENDLE_TOKENS.items():
-                try:
-                    balance = await self.get_token_balance(session, address, token_addr, decimals)
-                    if balance > 0:
-                        token = TokenBalance(
-                            symbol=symbol,
-                            name=name,
-                            balance=balance,
-                            contract_address=token_addr,
-                            decimals=decimals,
-                            token_type=pos_type
-                        )
-                        pendle_positions[pos_type].append(token)
-                    await asyncio.sleep(self.api_delay)  # API 限流延迟
-                except Exception:
-                    continue
-            
-            # 创建 Pendle DeFi 仓位
-            if pendle_positions["pt"] or pendle_positions["yt"]:
-                defi_positions.append(DeFiPosition(
-                    protocol="Pendle",
-                    position_type="yield",
-                    tokens=pendle_positions["pt"] + pendle_positions["yt"]
+        session = self.get_session()
+        # ETH 余额与 ERC-20 代币余额 (批量查询，每批最多 RPC_BATCH_SIZE 个) 并发获取
+        native_balance, balances = await asyncio.gather(
+            self.get_native_balance(session, address),
+            self.get_token_balances(session, address, self.TOKEN_DECIMALS)
+        )
+        
+        # 获取常见 ERC-20 代币余额
+        for token_addr, (symbol, name, decimals) in self.KNOWN_TOKENS.items():
+            balance = balances.get(token_addr, 0.0)
+            if balance > 0:
+                tokens.append(TokenBalance(
+                    symbol=symbol,
+                    name=name,
+                    balance=balance,
+                    contract_address=token_addr,
+                    decimals=decimals,
+                    token_type="token"
                 ))
-            
-            if pendle_positions["lp"]:
-                defi_positions.append(DeFiPosition(
-                    protocol="Pendle",
-                    position_type="liquidity",
-                    tokens=pendle_positions["lp"]
+        
+        # 获取 Staking 代币余额
+        for token_addr, (symbol, name, decimals, protocol, pos_type) in self.STAKING_TOKENS.items():
+            balance = balances.get(token_addr, 0.0)
+            if balance > 0:
+                token = TokenBalance(
+                    symbol=symbol,
+                    name=name,
+                    balance=balance,
+                    contract_address=token_addr,
+                    decimals=decimals,
+                    token_type=pos_type
+                )
+                staking_by_protocol.setdefault((protocol, pos_type), []).append(token)
+        
+        # ========== Aave V3 抵押品 (aTokens) ==========
+        for token_addr, (symbol, name, decimals, underlying) in self.AAVE_V3_ATOKENS.items():
+            balance = balances.get(token_addr, 0.0)
+            if balance > 0:
+                aave_supplied.append(TokenBalance(
+                    symbol=underlying,  # 显示底层资产符号
+                    name=f"Aave 抵押 {underlying}",
+                    balance=balance,
+                    contract_address=token_addr,
+                    decimals=decimals,
+                    token_type="collateral"
                 ))
-            
-            # PENDLE 治理代币放到普通代币
-            for token in pendle_positions["token"]:
-                tokens.append(token)
-            
-            # 创建 Staking DeFi 仓位
-            for key, tokens_list in staking_by_protocol.items():
-                protocol, pos_type = key.split("|")
-                defi_positions.append(DeFiPosition(
-                    protocol=protocol,
-                    position_type=pos_type,
-                    tokens=tokens_list
+        
+        # ========== Aave V3 债务 (Variable Debt Tokens) ==========
+        for token_addr, (symbol, name, decimals, underlying) in self.AAVE_V3_DEBT_TOKENS.items():
+            balance = balances.get(token_addr, 0.0)
+            if balance > 0:
+                aave_borrowed.append(TokenBalance(
+                    symbol=underlying,  # 显示底层资产符号
+                    name=f"Aave 债务 {underlying}",
+                    balance=balance,
+                    contract_address=token_addr,
+                    decimals=decimals,
+                    token_type="debt"
                 ))
-            
-            # 创建 Aave 借贷仓位
-            if aave_supplied or aave_borrowed:
-                lending_details = LendingPosition(
-                    protocol="Aave V3",
-                    supplied=aave_supplied,
-                    borrowed=aave_borrowed
+        
+        # ========== Pendle 代币 ==========
+        pendle_positions: Dict[str, List[TokenBalance]] = {
+            "pt": [], "yt": [], "lp": [], "token": []
+        }
+        
+        for token_addr, (symbol, name, decimals, pos_type) in self.PENDLE_TOKENS.items():
+            balance = balances.get(token_addr, 0.0)
+            if balance > 0:
+                token = TokenBalance(
+                    symbol=symbol,
+                    name=name,
+                    balance=balance,
+                    contract_address=token_addr,
+                    decimals=decimals,
+                    token_type=pos_type
                 )
-                defi_positions.append(DeFiPosition(
-                    protocol="Aave V3",
-                    position_type="lending",
-                    tokens=aave_supplied + aave_borrowed,
-                    lending_details=lending_details
-                ))
+                pendle_positions[pos_type].append(token)
+        
+        # 创建 Pendle DeFi 仓位
+        if pendle_positions["pt"] or pendle_positions["yt"]:
+            defi_positions.append(DeFiPosition(
+                protocol="Pendle",
+                position_type="yield",
+                tokens=pendle_positions["pt"] + pendle_positions["yt"]
+            ))
+        
+        if pendle_positions["lp"]:
+            defi_positions.append(DeFiPosition(
+                protocol="Pendle",
+                position_type="liquidity",
+                tokens=pendle_positions["lp"]
+            ))
+        
+        # PENDLE 治理代币放到普通代币
+        for token in pendle_positions["token"]:
+            tokens.append(token)
+        
+        # 创建 Staking DeFi 仓位
+        for (protocol, pos_type), tokens_list in staking_by_protocol.items():
+            defi_positions.append(DeFiPosition(
+                protocol=protocol,
+                position_type=pos_type,
+                tokens=tokens_list
+            ))
+        
+        # 创建 Aave 借贷仓位
+        if aave_supplied or aave_borrowed:
+            lending_details = LendingPosition(
+                protocol="Aave V3",
+                supplied=aave_supplied,
+                borrowed=aave_borrowed
+            )
+            defi_positions.append(DeFiPosition(
+                protocol="Aave V3",
+                position_type="lending",
+                tokens=aave_supplied + aave_borrowed,
+                lending_details=lending_details
+            ))
         
         return native_balance, tokens, defi_positions
 
@@ -410,8 +592,17 @@ class EthereumMonitor(ChainMonitor):
 class SolanaMonitor(ChainMonitor):
     """Solana 链监控 - 支持 SPL 代币和 DeFi"""
     
+    # base58 编码的 32 字节公钥
+    ADDRESS_PATTERN = re.compile(r"[1-9A-HJ-NP-Za-km-z]{32,44}")
+    
     _token_list_cache: Optional[Dict[str, dict]] = None
     _cache_time: Optional[datetime] = None
+    _token_list_task: Optional[asyncio.Future] = None  # 进行中的加载任务
+    
+    # Jupiter 代币列表缓存 (内存 + gzip 压缩的磁盘副本)
+    TOKEN_LIST_TTL = 3600
+    TOKEN_LIST_CACHE_FILE = Path(".cache/jup_token_list.json.gz")
+    TOKEN_LIST_COMPRESS_LEVEL = 5  # 默认的 9 压缩数 MB 列表要近 1 秒，5 体积相差无几
     
     DEFI_TOKENS = {
         # ========== 质押代币 ==========
@@ -447,9 +638,15 @@ class SolanaMonitor(ChainMonitor):
     # Jupiter Perpetuals Program
     JUP_PERP_PROGRAM = "PERPHjGBqRHArX4DySjwM6UJHiR3sWAatqfdBS2qQJu"
     
+    # 归入 DeFi 仓位的代币类型
+    DEFI_TOKEN_TYPES = frozenset(("staking", "liquidity", "lending"))
+    
     LP_PATTERNS = ["LP", "AMM", "POOL", "Liquidity"]
     STAKE_PATTERNS = ["staked", "stSOL", "mSOL", "jitoSOL", "bSOL", "jupSOL"]
     
+    # 预先转成小写，避免每次分类时重复转换
+    _STAKE_PATTERNS_LOWER = tuple(p.lower() for p in STAKE_PATTERNS)
+    
     @property
     def chain_name(self) -> str:
         return "Solana"
@@ -458,31 +655,91 @@ class SolanaMonitor(ChainMonitor):
     def symbol(self) -> str:
         return "SOL"
     
+    def _read_token_list_file(self, max_age: Optional[float]) -> Optional[bytes]:
+        """读取磁盘缓存的代币列表，max_age 为 None 时忽略过期时间"""
+        path = self.TOKEN_LIST_CACHE_FILE
+        try:
+            if max_age is not None and time.time() - path.stat().st_mtime >= max_age:
+                return None
+            return gzip.decompress(path.read_bytes())
+        except (OSError, EOFError, zlib.error):
+            return None  # 缓存文件缺失或损坏，按无缓存处理
+    
+    def _write_token_list_file(self, raw: bytes):
+        """压缩写入磁盘缓存；先写临时文件再原子替换，CLI 与服务同时写入也不会留下半截文件"""
+        path = self.TOKEN_LIST_CACHE_FILE
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(gzip.compress(raw, compresslevel=self.TOKEN_LIST_COMPRESS_LEVEL))
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    
+    def _set_token_list(self, raw: bytes) -> Dict[str, dict]:
+        tokens = orjson.loads(raw)
+        SolanaMonitor._token_list_cache = {t["address"]: t for t in tokens}
+        SolanaMonitor._cache_time = datetime.now()
+        return SolanaMonitor._token_list_cache
+    
     async def _load_token_list(self, session: aiohttp.ClientSession) -> Dict[str, dict]:
         if (self._token_list_cache is not None and 
             self._cache_time is not None and
-            (datetime.now() - self._cache_time).seconds < 3600):
+            (datetime.now() - self._cache_time).total_seconds() < self.TOKEN_LIST_TTL):
             return self._token_list_cache
         
+        # 多个钱包并发查询时只加载一次，其余调用等待同一个任务
+        task = SolanaMonitor._token_list_task
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._fetch_token_list(session))
+            SolanaMonitor._token_list_task = task
+        # shield: 某个调用方被取消时不影响其他等待者
+        return await asyncio.shield(task)
+    
+    async def _fetch_token_list(self, session: aiohttp.ClientSession) -> Dict[str, dict]:
+        # 磁盘读写与 gzip 压缩/解压放到线程中执行，不阻塞事件循环
+        loop = asyncio.get_running_loop()
+        
+        # 重启后优先使用未过期的磁盘缓存，避免重复下载数 MB 的列表
+        raw = await loop.run_in_executor(None, self._read_token_list_file, self.TOKEN_LIST_TTL)
+        if raw is not None:
+            try:
+                return self._set_token_list(raw)
+            except Exception:
+                pass
+        
         try:
             url = "https://token.jup.ag/all"
             async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
                 if response.status == 200:
-                    tokens = await response.json()
-                    SolanaMonitor._token_list_cache = {t["address"]: t for t in tokens}
-                    SolanaMonitor._cache_time = datetime.now()
-                    return SolanaMonitor._token_list_cache
+                    raw = await response.read()
+                    token_list = self._set_token_list(raw)
+                    await loop.run_in_executor(None, self._write_token_list_file, raw)
+                    return token_list
         except Exception:
             pass
+        
+        # 下载失败时退回到过期的磁盘缓存
+        raw = await loop.run_in_executor(None, self._read_token_list_file, None)
+        if raw is not None:
+            try:
+                return self._set_token_list(raw)
+            except Exception:
+                pass
         return {}
     
     def _classify_token(self, symbol: str, name: str, mint: str) -> str:
-        upper_name = name.upper()
-        upper_symbol = symbol.upper()
-        
-        if any(p in upper_name or p in upper_symbol for p in self.LP_PATTERNS):
+        # 名称和符号拼成一个字符串，每类模式只需扫描一次
+        # LP 模式按原样与大写文本比较 (因此 "Liquidity" 实际不会命中)，保持原有分类结果
+        upper_text = f"{symbol}\n{name}".upper()
+        if any(p in upper_text for p in self.LP_PATTERNS):
             return "liquidity"
-        if any(p.lower() in symbol.lower() or p.lower() in name.lower() for p in self.STAKE_PATTERNS):
+        
+        lower_text = f"{symbol}\n{name}".lower()
+        if any(p in lower_text for p in self._STAKE_PATTERNS_LOWER):
             return "staking"
         if mint in self.DEFI_TOKENS:
             return self.DEFI_TOKENS[mint][4]
@@ -508,10 +765,9 @@ class SolanaMonitor(ChainMonitor):
                 "id": 1
             }
             
-            async with session.post(rpc_url, json=payload) as response:
-                data = await response.json()
-                # Kamino 的账户结构比较复杂，这里简化处理
-                # 实际使用中可能需要更详细的解析
+            data = await rpc_post(session, rpc_url, payload, self.rate_limiter)
+            # Kamino 的账户结构比较复杂，这里简化处理
+            # 实际使用中可能需要更详细的解析
                 
         except Exception as e:
             pass
@@ -522,114 +778,113 @@ class SolanaMonitor(ChainMonitor):
         rpc_url = self.config.get("rpc_url", "https://api.mainnet-beta.solana.com")
         tokens = []
         defi_positions = []
-        defi_by_protocol: Dict[str, List[TokenBalance]] = {}
+        defi_by_protocol: Dict[Tuple[str, str], List[TokenBalance]] = {}
         kamino_supplied: List[TokenBalance] = []
         kamino_borrowed: List[TokenBalance] = []
-        native_balance = 0.0
         
-        async with aiohttp.ClientSession() as session:
-            token_list = await self._load_token_list(session)
-            
-            payload = {"jsonrpc": "2.0", "method": "getBalance", "params": [address], "id": 1}
-            async with session.post(rpc_url, json=payload) as response:
-                data = await response.json()
-                if "result" in data:
-                    native_balance = data["result"]["value"] / 1e9
-            
-            payload = {
-                "jsonrpc": "2.0",
-                "method": "getTokenAccountsByOwner",
-                "params": [address, {"programId": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"}, {"encoding": "jsonParsed"}],
-                "id": 2
-            }
-            
-            async with session.post(rpc_url, json=payload) as response:
-                data = await response.json()
-                if "result" in data:
-                    for account in data["result"].get("value", []):
-                        try:
-                            parsed = account["account"]["data"]["parsed"]["info"]
-                            token_amount = parsed["tokenAmount"]
-                            balance = float(token_amount["uiAmount"] or 0)
+        session = self.get_session()
+        # 原生余额与代币账户合并为一次批量请求，省去一次往返；代币列表同时加载
+        token_list, (balance_result, accounts_result) = await asyncio.gather(
+            self._load_token_list(session),
+            rpc_batch(session, rpc_url, [
+                ("getBalance", [address]),
+                ("getTokenAccountsByOwner", [
+                    address,
+                    {"programId": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"},
+                    {"encoding": "jsonParsed"}
+                ]),
+            ], self.rate_limiter)
+        )
+        if balance_result is None:
+            raise RpcError(f"getBalance 查询失败: {address}")
+        native_balance = balance_result["value"] / 1e9
+        
+        if accounts_result:
+            # 循环外绑定常用查找
+            get_token_info = token_list.get
+            get_defi_token = self.DEFI_TOKENS.get
+            for account in accounts_result.get("value", []):
+                try:
+                    parsed = account["account"]["data"]["parsed"]["info"]
+                    token_amount = parsed["tokenAmount"]
+                    # 已清空的代币账户很常见，直接跳过
+                    if token_amount.get("amount") == "0":
+                        continue
+                    # orjson 已把 uiAmount / decimals 解码为数值，无需再转换
+                    balance = token_amount["uiAmount"] or 0.0
+                    decimals = token_amount["decimals"]
+                    
+                    if balance > 0:
+                        mint = parsed["mint"]
+                        defi_info = get_defi_token(mint)
+                        
+                        if defi_info is not None:
+                            def_symbol, def_name, _, protocol, pos_type = defi_info
+                            token = TokenBalance(
+                                symbol=def_symbol, 
+                                name=def_name, 
+                                balance=balance,
+                                contract_address=mint, 
+                                decimals=decimals,
+                                token_type=pos_type
+                            )
                             
-                            if balance > 0:
-                                mint = parsed["mint"]
-                                token_info = token_list.get(mint, {})
-                                symbol = token_info.get("symbol", mint[:8])
-                                name = token_info.get("name", "Unknown Token")
-                                
-                                if mint in self.DEFI_TOKENS:
-                                    def_symbol, def_name, _, protocol, pos_type = self.DEFI_TOKENS[mint]
-                                    token = TokenBalance(
-                                        symbol=def_symbol, 
-                                        name=def_name, 
-                                        balance=balance,
-                                        contract_address=mint, 
-                                        decimals=int(token_amount["decimals"]),
-                                        token_type=pos_type
-                                    )
-                                    
-                                    # Kamino kTokens 特殊处理
-                                    if protocol == "Kamino" and def_symbol.startswith("k"):
-                                        kamino_supplied.append(token)
-                                    else:
-                                        key = f"{protocol}|{pos_type}"
-                                        if key not in defi_by_protocol:
-                                            defi_by_protocol[key] = []
-                                        defi_by_protocol[key].append(token)
-                                else:
-                                    token_type = self._classify_token(symbol, name, mint)
-                                    token = TokenBalance(
-                                        symbol=symbol, 
-                                        name=name, 
-                                        balance=balance,
-                                        contract_address=mint, 
-                                        decimals=int(token_amount["decimals"]),
-                                        token_type=token_type
-                                    )
-                                    
-                                    if token_type in ["staking", "liquidity", "lending"]:
-                                        key = f"Unknown|{token_type}"
-                                        if key not in defi_by_protocol:
-                                            defi_by_protocol[key] = []
-                                        defi_by_protocol[key].append(token)
-                                    else:
-                                        tokens.append(token)
-                        except Exception:
-                            continue
-            
-            # 创建 DeFi 仓位
-            for key, tokens_list in defi_by_protocol.items():
-                protocol, pos_type = key.split("|")
-                defi_positions.append(DeFiPosition(
-                    protocol=protocol, 
-                    position_type=pos_type, 
-                    tokens=tokens_list
-                ))
-            
-            # Kamino 借贷仓位
-            if kamino_supplied:
-                lending_details = LendingPosition(
-                    protocol="Kamino",
-                    supplied=kamino_supplied,
-                    borrowed=kamino_borrowed  # TODO: 需要从链上查询债务
-                )
-                defi_positions.append(DeFiPosition(
-                    protocol="Kamino",
-                    position_type="lending",
-                    tokens=kamino_supplied,
-                    lending_details=lending_details
-                ))
+                            # Kamino kTokens 特殊处理
+                            if protocol == "Kamino" and def_symbol.startswith("k"):
+                                kamino_supplied.append(token)
+                            else:
+                                defi_by_protocol.setdefault((protocol, pos_type), []).append(token)
+                        else:
+                            # 只有非 DeFi 代币才需要代币列表里的名称
+                            token_info = get_token_info(mint, {})
+                            symbol = token_info.get("symbol", mint[:8])
+                            name = token_info.get("name", "Unknown Token")
+                            token_type = self._classify_token(symbol, name, mint)
+                            token = TokenBalance(
+                                symbol=symbol, 
+                                name=name, 
+                                balance=balance,
+                                contract_address=mint, 
+                                decimals=decimals,
+                                token_type=token_type
+                            )
+                            
+                            if token_type in self.DEFI_TOKEN_TYPES:
+                                defi_by_protocol.setdefault(("Unknown", token_type), []).append(token)
+                            else:
+                                tokens.append(token)
+                except Exception:
+                    continue
+        
+        # 创建 DeFi 仓位
+        for (protocol, pos_type), tokens_list in defi_by_protocol.items():
+            defi_positions.append(DeFiPosition(
+                protocol=protocol, 
+                position_type=pos_type, 
+                tokens=tokens_list
+            ))
+        
+        # Kamino 借贷仓位
+        if kamino_supplied:
+            lending_details = LendingPosition(
+                protocol="Kamino",
+                supplied=kamino_supplied,
+                borrowed=kamino_borrowed  # TODO: 需要从链上查询债务
+            )
+            defi_positions.append(DeFiPosition(
+                protocol="Kamino",
+                position_type="lending",
+                tokens=kamino_supplied,
+                lending_details=lending_details
+            ))
         
         return native_balance, tokens, defi_positions
 
 
-class ArbitrumMonitor(ChainMonitor):
+class ArbitrumMonitor(EVMChainMonitor):
     """Arbitrum 链监控 - 支持 Pendle 和其他 DeFi"""
     
-    def __init__(self, config: dict):
-        super().__init__(config)
-        self.api_delay = config.get("api_delay", 0.1)
+    DEFAULT_RPC_URL = "https://arb1.arbitrum.io/rpc"
     
     # 常见代币
     KNOWN_TOKENS = {
@@ -693,6 +948,13 @@ class ArbitrumMonitor(ChainMonitor):
         "0xB688BA096b7Bb75d7841e47163Cd12D18B36A5bF": ("mPENDLE", "mPENDLE", 18, "staking"),
     }
     
+    # 批量查询用的 {合约地址: 精度}，类定义时生成一次
+    TOKEN_DECIMALS = {
+        token_addr: info[2]
+        for table in (KNOWN_TOKENS, PENDLE_TOKENS)
+        for token_addr, info in table.items()
+    }
+    
     @property
     def chain_name(self) -> str:
         return "Arbitrum"
@@ -701,49 +963,6 @@ class ArbitrumMonitor(ChainMonitor):
     def symbol(self) -> str:
         return "ETH"
     
-    async def get_native_balance(self, session: aiohttp.ClientSession, address: str) -> float:
-        """获取 ETH 余额"""
-        rpc_url = self.config.get("rpc_url", "https://arb1.arbitrum.io/rpc")
-        
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "eth_getBalance",
-            "params": [address, "latest"],
-            "id": 1
-        }
-        
-        async with session.post(rpc_url, json=payload) as response:
-            data = await response.json()
-            if "result" in data:
-                balance_wei = int(data["result"], 16)
-                return balance_wei / 1e18
-            return 0.0
-    
-    async def get_token_balance(self, session: aiohttp.ClientSession, 
-                                 address: str, token_address: str, 
-                                 decimals: int) -> float:
-        """获取 ERC-20 代币余额"""
-        rpc_url = self.config.get("rpc_url", "https://arb1.arbitrum.io/rpc")
-        
-        data = f"0x70a08231000000000000000000000000{address[2:].lower()}"
-        
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "eth_call",
-            "params": [{"to": token_address, "data": data}, "latest"],
-            "id": 1
-        }
-        
-        try:
-            async with session.post(rpc_url, json=payload) as response:
-                result = await response.json()
-                if "result" in result and result["result"] not in ["0x", "0x0"]:
-                    balance = int(result["result"], 16)
-                    return balance / (10 ** decimals)
-        except Exception:
-            pass
-        return 0.0
-    
     async def get_balance(self, address: str) -> Tuple[float, List[TokenBalance], List[DeFiPosition]]:
         """获取 Arbitrum 资产"""
         tokens = []
@@ -752,70 +971,65 @@ class ArbitrumMonitor(ChainMonitor):
             "pt": [], "yt": [], "lp": [], "token": [], "staking": []
         }
         
-        async with aiohttp.ClientSession() as session:
-            # 获取 ETH 余额
-            native_balance = await self.get_native_balance(session, address)
-            
-            # 获取常见代币余额
-            for token_addr, (symbol, name, decimals) in self.KNOWN_TOKENS.items():
-                try:
-                    balance = await self.get_token_balance(session, address, token_addr, decimals)
-                    if balance > 0:
-                        tokens.append(TokenBalance(
-                            symbol=symbol,
-                            name=name,
-                            balance=balance,
-                            contract_address=token_addr,
-                            decimals=decimals,
-                            token_type="token"
-                        ))
-                    await asyncio.sleep(self.api_delay)
-                except Exception:
-                    continue
-            
-            # 获取 Pendle 代币
-            for token_addr, (symbol, name, decimals, pos_type) in self.PENDLE_TOKENS.items():
-                try:
-                    balance = await self.get_token_balance(session, address, token_addr, decimals)
-                    if balance > 0:
-                        token = TokenBalance(
-                            symbol=symbol,
-                            name=name,
-                            balance=balance,
-                            contract_address=token_addr,
-                            decimals=decimals,
-                            token_type=pos_type
-                        )
-                        pendle_positions[pos_type].append(token)
-                    await asyncio.sleep(self.api_delay)
-                except Exception:
-                    continue
-            
-            # 创建 Pendle DeFi 仓位
-            if pendle_positions["pt"] or pendle_positions["yt"]:
-                defi_positions.append(DeFiPosition(
-                    protocol="Pendle",
-                    position_type="yield",
-                    tokens=pendle_positions["pt"] + pendle_positions["yt"]
-                ))
-            
-            if pendle_positions["lp"]:
-                defi_positions.append(DeFiPosition(
-                    protocol="Pendle",
-                    position_type="liquidity",
-                    tokens=pendle_positions["lp"]
-                ))
-            
-            if pendle_positions["staking"]:
-                defi_positions.append(DeFiPosition(
-                    protocol="Penpie",
-                    position_type="staking",
-                    tokens=pendle_positions["staking"]
+        session = self.get_session()
+        # ETH 余额与代币余额 (一次批量查询) 并发获取
+        native_balance, balances = await asyncio.gather(
+            self.get_native_balance(session, address),
+            self.get_token_balances(session, address, self.TOKEN_DECIMALS)
+        )
+        
+        # 获取常见代币余额
+        for token_addr, (symbol, name, decimals) in self.KNOWN_TOKENS.items():
+            balance = balances.get(token_addr, 0.0)
+            if balance > 0:
+                tokens.append(TokenBalance(
+                    symbol=symbol,
+                    name=name,
+                    balance=balance,
+                    contract_address=token_addr,
+                    decimals=decimals,
+                    token_type="token"
                 ))
-            
-            # PENDLE 治理代币
-            for token in pendle_positions["token"]:
-                tokens.append(token)
+        
+        # 获取 Pendle 代币
+        for token_addr, (symbol, name, decimals, pos_type) in self.PENDLE_TOKENS.items():
+            balance = balances.get(token_addr, 0.0)
+            if balance > 0:
+                token = TokenBalance(
+                    symbol=symbol,
+                    name=name,
+                    balance=balance,
+                    contract_address=token_addr,
+                    decimals=decimals,
+                    token_type=pos_type
+                )
+                pendle_positions[pos_type].append(token)
+        
+        # 创建 Pendle DeFi 仓位
+        if pendle_positions["pt"] or pendle_positions["yt"]:
+            defi_positions.append(DeFiPosition(
+                protocol="Pendle",
+                position_type="yield",
+                tokens=pendle_positions["pt"] + pendle_positions["yt"]
+            ))
+        
+        if pendle_positions["lp"]:
+            defi_positions.append(DeFiPosition(
+                protocol="Pendle",
+                position_type="liquidity",
+                tokens=pendle_positions["lp"]
+            ))
+        
+        if pendle_positions["staking"]:
+            defi_positions.append(DeFiPosition(
+                protocol="Penpie",
+                position_type="staking",
+                tokens=pendle_positions["staking"]
+            ))
+        
+        # PENDLE 治理代币
+        for token in pendle_positions["token"]:
+            tokens.append(token)
         
         return native_balance, tokens, defi_positions
 
@@ -823,6 +1037,9 @@ class ArbitrumMonitor(ChainMonitor):
 class AptosMonitor(ChainMonitor):
     """Aptos 链监控"""
     
+    COIN_STORE_PREFIX = "0x1::coin::CoinStore<"
+    ADDRESS_PATTERN = re.compile(r"0x[0-9a-fA-F]{1,64}")
+    
     @property
     def chain_name(self) -> str:
         return "Aptos"
@@ -837,35 +1054,36 @@ class AptosMonitor(ChainMonitor):
         defi_positions = []
         native_balance = 0.0
         
-        async with aiohttp.ClientSession() as session:
-            url = f"{api_url}/accounts/{address}/resources"
-            
-            try:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        resources = await response.json()
+        session = self.get_session()
+        url = f"{api_url}/accounts/{address}/resources"
+        
+        try:
+            async with session.get(url) as response:
+                if response.status == 200:
+                    resources = orjson.loads(await response.read())
+                    
+                    for resource in resources:
+                        res_type = resource.get("type", "")
                         
-                        for resource in resources:
-                            res_type = resource.get("type", "")
-                            
-                            if "0x1::coin::CoinStore<" in res_type:
-                                try:
-                                    coin_type = res_type.split("<")[1].rstrip(">")
-                                    value = int(resource["data"]["coin"]["value"])
-                                    
-                                    if coin_type == "0x1::aptos_coin::AptosCoin":
-                                        native_balance = value / 1e8
-                                    else:
-                                        if value > 0:
-                                            symbol = self._parse_coin_symbol(coin_type)
-                                            tokens.append(TokenBalance(
-                                                symbol=symbol, name=coin_type.split("::")[-1],
-                                                balance=value / 1e8, contract_address=coin_type, decimals=8
-                                            ))
-                                except Exception:
-                                    continue
-            except Exception as e:
-                print(f"APT API Error: {e}")
+                        if res_type.startswith(self.COIN_STORE_PREFIX):
+                            try:
+                                # 只截取泛型参数中的币种类型，不拆分整个类型字符串
+                                coin_type = res_type[len(self.COIN_STORE_PREFIX):].partition("<")[0].rstrip(">")
+                                value = int(resource["data"]["coin"]["value"])
+                                
+                                if coin_type == "0x1::aptos_coin::AptosCoin":
+                                    native_balance = value / 1e8
+                                else:
+                                    if value > 0:
+                                        symbol = self._parse_coin_symbol(coin_type)
+                                        tokens.append(TokenBalance(
+                                            symbol=symbol, name=coin_type.rpartition("::")[2],
+                                            balance=value / 1e8, contract_address=coin_type, decimals=8
+                                        ))
+                            except Exception:
+                                continue
+        except Exception as e:
+            print(f"APT API Error: {e}")
         
         return native_balance, tokens, defi_positions
     
@@ -910,32 +1128,50 @@ class PriceService:
         "mfiSOL": "solana",
     }
     
-    def __init__(self):
+    # 按 1 美元计价的稳定币
+    STABLECOINS = frozenset(("USDT", "USDC", "DAI", "BUSD", "TUSD"))
+    
+    PRICE_URL = (
+        "https://api.coingecko.com/api/v3/simple/price?ids="
+        + ",".join(sorted(set(COINGECKO_IDS.values())))
+        + "&vs_currencies=usd"
+    )
+    # 价格在此时间内视为最新，连续刷新时不重复请求 CoinGecko (免费接口限流较严)
+    PRICE_TTL = 60
+    
+    def __init__(self, http: Optional[HttpSession] = None):
         self.prices: Dict[str, float] = {}
         self.last_update: Optional[datetime] = None
+        self.http = http or HttpSession()
+    
+    async def close(self):
+        """关闭 HTTP 会话"""
+        await self.http.close()
     
     async def update_prices(self) -> Dict[str, float]:
-        ids = ",".join(set(self.COINGECKO_IDS.values()))
-        url = f"https://api.coingecko.com/api/v3/simple/price?ids={ids}&vs_currencies=usd"
+        if (self.last_update is not None and
+            (datetime.now() - self.last_update).total_seconds() < self.PRICE_TTL):
+            return self.prices
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        for symbol, coin_id in self.COINGECKO_IDS.items():
-                            if coin_id in data and "usd" in data[coin_id]:
-                                self.prices[symbol] = data[coin_id]["usd"]
-                        self.last_update = datetime.now()
+            session = self.http.get()
+            async with session.get(self.PRICE_URL, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    for symbol, coin_id in self.COINGECKO_IDS.items():
+                        if coin_id in data and "usd" in data[coin_id]:
+                            self.prices[symbol] = data[coin_id]["usd"]
+                    self.last_update = datetime.now()
         except Exception as e:
             print(f"⚠️  获取价格失败: {e}")
         
         return self.prices
     
     def get_price(self, symbol: str) -> Optional[float]:
-        if symbol.upper() in ["USDT", "USDC", "DAI", "BUSD", "TUSD"]:
+        upper = symbol.upper()
+        if upper in self.STABLECOINS:
             return 1.0
-        return self.prices.get(symbol) or self.prices.get(symbol.upper())
+        return self.prices.get(symbol) or self.prices.get(upper)
 
 
 class WalletMonitor:
@@ -944,7 +1180,9 @@ class WalletMonitor:
     def __init__(self, config_path: str = "config.yaml"):
         self.config = self._load_config(config_path)
         self.monitors: Dict[str, ChainMonitor] = {}
-        self.price_service = PriceService()
+        # 各链监控器与价格服务共用一个会话 (一个连接池)
+        self.http = HttpSession(self.config.get("request_timeout", REQUEST_TIMEOUT))
+        self.price_service = PriceService(self.http)
         self._init_monitors()
     
     def _load_config(self, config_path: str) -> dict:
@@ -961,57 +1199,63 @@ class WalletMonitor:
         if "ethereum" in self.config:
             eth_config = self.config["ethereum"].copy()
             eth_config["api_delay"] = api_delay
-            self.monitors["ethereum"] = EthereumMonitor(eth_config)
+            self.monitors["ethereum"] = EthereumMonitor(eth_config, self.http)
         if "solana" in self.config:
             sol_config = self.config["solana"].copy()
             sol_config["api_delay"] = api_delay
-            self.monitors["solana"] = SolanaMonitor(sol_config)
+            self.monitors["solana"] = SolanaMonitor(sol_config, self.http)
         if "arbitrum" in self.config:
             arb_config = self.config["arbitrum"].copy()
             arb_config["api_delay"] = api_delay
-            self.monitors["arbitrum"] = ArbitrumMonitor(arb_config)
+            self.monitors["arbitrum"] = ArbitrumMonitor(arb_config, self.http)
         if "aptos" in self.config:
             apt_config = self.config["aptos"].copy()
             apt_config["api_delay"] = api_delay
-            self.monitors["aptos"] = AptosMonitor(apt_config)
+            self.monitors["aptos"] = AptosMonitor(apt_config, self.http)
     
-    async def check_balance(self, chain: str, wallet: dict) -> Optional[WalletBalance]:
+    async def close(self):
+        """关闭各链监控器与价格服务共用的 HTTP 会话"""
+        await self.http.close()
+    
+    def _value_tokens(self, tokens: List[TokenBalance]) -> float:
+        """为代币列表填充 USD 价值，返回有价格部分的合计"""
+        get_price = self.price_service.get_price  # 循环外绑定，避免重复属性查找
+        total = 0.0
+        for token in tokens:
+            token_price = get_price(token.symbol)
+            if token_price:
+                token.usd_value = token.balance * token_price
+                total += token.usd_value
+        return total
+    
+    async def check_balance(self, chain: str, wallet: dict,
+                            prices_ready: Optional[asyncio.Future] = None) -> Optional[WalletBalance]:
         monitor = self.monitors.get(chain)
         if not monitor:
             return None
         
         try:
             native_balance, tokens, defi_positions = await monitor.get_balance(wallet["address"])
+            
+            # 价格与余额并行获取，计价前等待价格就绪
+            if prices_ready is not None:
+                await prices_ready
+            
             price = self.price_service.get_price(monitor.symbol)
             native_usd = native_balance * price if price else None
             
             # 计算代币 USD 价值
-            for token in tokens:
-                token_price = self.price_service.get_price(token.symbol)
-                if token_price:
-                    token.usd_value = token.balance * token_price
+            self._value_tokens(tokens)
             
             # 计算 DeFi 仓位 USD 价值
             for position in defi_positions:
-                total = 0.0
-                
                 # 如果有借贷详情，计算详细价值
                 if position.lending_details:
                     ld = position.lending_details
                     
-                    # 计算抵押品价值
-                    for token in ld.supplied:
-                        token_price = self.price_service.get_price(token.symbol)
-                        if token_price:
-                            token.usd_value = token.balance * token_price
-                            ld.total_supplied_usd += token.usd_value
-                    
-                    # 计算债务价值
-                    for token in ld.borrowed:
-                        token_price = self.price_service.get_price(token.symbol)
-                        if token_price:
-                            token.usd_value = token.balance * token_price
-                            ld.total_borrowed_usd += token.usd_value
+                    # 计算抵押品和债务价值
+                    ld.total_supplied_usd += self._value_tokens(ld.supplied)
+                    ld.total_borrowed_usd += self._value_tokens(ld.borrowed)
                     
                     # 计算净值
                     ld.net_worth_usd = ld.total_supplied_usd - ld.total_borrowed_usd
@@ -1022,11 +1266,7 @@ class WalletMonitor:
                     
                     position.total_usd_value = ld.net_worth_usd
                 else:
-                    for token in position.tokens:
-                        token_price = self.price_service.get_price(token.symbol)
-                        if token_price:
-                            token.usd_value = token.balance * token_price
-                            total += token.usd_value
+                    total = self._value_tokens(position.tokens)
                     position.total_usd_value = total if total > 0 else None
             
             return WalletBalance(
@@ -1044,12 +1284,24 @@ class WalletMonitor:
             print(f"❌ 获取 {chain} 钱包 {wallet.get('name')} 失败: {e}")
             return None
     
-    async def check_all_balances(self) -> List[WalletBalance]:
+    async def check_all_balances(self, prices_ready: Optional[asyncio.Future] = None) -> List[WalletBalance]:
+        """查询所有钱包余额；传入价格更新任务时，余额查询与价格获取并行进行"""
+        # 限制同时查询的钱包数，避免所有钱包的请求同时打到公共 RPC
+        semaphore = asyncio.Semaphore(self.config.get("max_concurrency", 8))
+        
+        async def bounded_check(chain: str, wallet: dict) -> Optional[WalletBalance]:
+            async with semaphore:
+                return await self.check_balance(chain, wallet, prices_ready)
+        
         tasks = []
-        for chain in self.monitors:
+        for chain, monitor in self.monitors.items():
             wallets = self.config.get(chain, {}).get("wallets", [])
             for wallet in wallets:
-                tasks.append(self.check_balance(chain, wallet))
+                # 地址格式错误时直接跳过，不浪费 RPC 请求和并发名额
+                if not monitor.is_valid_address(wallet.get("address", "")):
+                    print(f"⚠️  跳过 {chain} 钱包 {wallet.get('name')}: 地址格式无效")
+                    continue
+                tasks.append(bounded_check(chain, wallet))
         
         balances = await asyncio.gather(*tasks)
         return [b for b in balances if b is not None]
@@ -1130,22 +1382,27 @@ class WalletMonitor:
         return "\n".join(lines)
     
     async def run_once(self) -> List[WalletBalance]:
-        print(f"\n{'='*70}")
-        print(f"⏰ 检查时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*70}")
-        
-        print("📈 获取代币价格...")
-        await self.price_service.update_prices()
-        
-        print("🔍 查询钱包余额 (包括 DeFi 借贷详情)...\n")
-        balances = await self.check_all_balances()
+        # 表头一次写出并立即刷新，输出被管道重定向时也能在等待查询前看到进度
+        sys.stdout.write(
+            f"\n{'='*70}\n"
+            f"⏰ 检查时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"{'='*70}\n"
+            "📈 获取代币价格 & 🔍 查询钱包余额 (包括 DeFi 借贷详情)...\n\n"
+        )
+        sys.stdout.flush()
+        prices_task = asyncio.ensure_future(self.price_service.update_prices())
+        balances = await self.check_all_balances(prices_task)
+        await prices_task
         
         total_usd = 0.0
         total_defi = 0.0
         total_debt = 0.0
         
+        # 报告先缓存在内存中，最后一次性写出
+        out: List[str] = []
+        
         for balance in balances:
-            print(self._format_balance(balance))
+            out.append(self._format_balance(balance))
             
             if balance.native_usd_value:
                 total_usd += balance.native_usd_value
@@ -1161,13 +1418,16 @@ class WalletMonitor:
                     total_usd += pos.total_usd_value
                     total_defi += pos.total_usd_value
         
-        print(f"\n{'─'*70}")
-        print(f"💰 总资产净值: ${total_usd:,.2f} USD")
+        out.append(f"\n{'─'*70}")
+        out.append(f"💰 总资产净值: ${total_usd:,.2f} USD")
         if total_defi > 0:
-            print(f"🏦 DeFi 存入: ${total_defi:,.2f} USD")
+            out.append(f"🏦 DeFi 存入: ${total_defi:,.2f} USD")
         if total_debt > 0:
-            print(f"💸 DeFi 债务: ${total_debt:,.2f} USD")
-        print(f"{'='*70}")
+            out.append(f"💸 DeFi 债务: ${total_debt:,.2f} USD")
+        out.append(f"{'='*70}")
+        
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
         
         return balances
     
@@ -1194,15 +1454,26 @@ async def main():
     
     try:
         monitor = WalletMonitor(args.config)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return
+    
+    try:
         if args.once:
             await monitor.run_once()
         else:
             await monitor.run()
-    except FileNotFoundError as e:
-        print(f"❌ {e}")
     except KeyboardInterrupt:
         print("\n👋 已停止")
+    finally:
+        await monitor.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # 优先使用 uvloop (libuv 实现的事件循环)，未安装时退回标准 asyncio
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())